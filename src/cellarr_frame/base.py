@@ -1,6 +1,8 @@
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Any, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple, Union
 from warnings import warn
 
 import numpy as np
@@ -11,10 +13,93 @@ __author__ = "Jayaram Kancherla"
 __copyright__ = "Jayaram Kancherla"
 __license__ = "MIT"
 
+_CTX_POOL: Dict[FrozenSet[Tuple[str, str]], tiledb.Ctx] = {}
+_CTX_POOL_LOCK = threading.Lock()
+
+
+def _get_or_create_ctx(config_or_context: Optional[Union[tiledb.Config, tiledb.Ctx]]) -> Optional[tiledb.Ctx]:
+    """Resolve a TileDB Config or Ctx into a shared Ctx.
+
+    Each Ctx owns its own thread pools and VFS state, so frames opened with
+    equal configs share a single Ctx from a process-wide pool. ``None`` is
+    passed through, letting TileDB fall back to its global default Ctx.
+    """
+    if config_or_context is None or isinstance(config_or_context, tiledb.Ctx):
+        return config_or_context
+
+    if not isinstance(config_or_context, tiledb.Config):
+        raise TypeError("'config_or_context' must be a TileDB Config or Ctx object.")
+
+    key = frozenset(config_or_context.items())
+    with _CTX_POOL_LOCK:
+        ctx = _CTX_POOL.get(key)
+        if ctx is None:
+            ctx = tiledb.Ctx(config_or_context)
+            _CTX_POOL[key] = ctx
+
+    return ctx
+
+
+def _make_cache_key(row_spec: Any, col_spec: Optional[List[str]]) -> Optional[Tuple[Any, ...]]:
+    """Canonicalize a row/column selection into a hashable cache key.
+
+    Returns:
+        A hashable tuple, or None if the selection cannot be cached.
+    """
+    if isinstance(row_spec, slice):
+        rows = ("slice", row_spec.start, row_spec.stop, row_spec.step)
+    elif isinstance(row_spec, (str, int, np.integer)):
+        rows = (type(row_spec).__name__, row_spec)
+    elif isinstance(row_spec, np.ndarray):
+        rows = ("list", tuple(row_spec.tolist()))
+    elif isinstance(row_spec, (list, tuple)):
+        rows = ("list", tuple(row_spec))
+    else:
+        return None
+
+    cols = tuple(col_spec) if col_spec is not None else None
+
+    try:
+        hash((rows, cols))
+    except TypeError:
+        return None
+
+    return (rows, cols)
+
+
+def _decode_bytes(values: np.ndarray) -> np.ndarray:
+    """Decode an array of bytes (e.g. 'ascii' dimension coordinates) to str.
+
+    Arrays of any other type are returned unchanged.
+    """
+    if values.dtype.kind == "S" or (values.dtype == object and len(values) > 0 and isinstance(values[0], bytes)):
+        return np.char.decode(values.astype("S"), "utf-8").astype(object)
+
+    return values
+
 
 class CellArrayBaseFrame(ABC):
     """Abstract base class for TileDB DataFrame operations."""
 
+    __slots__ = (
+        "uri",
+        "_mode",
+        "_ctx",
+        "_array_passed_in",
+        "_opened_array_external",
+        "_cached_read_array",
+        "_read_cache",
+        "_read_cache_size",
+        "_dtype_backend",
+        "_schema_cache",
+        "_column_names",
+        "_index_names",
+        "_shape",
+        "_nonempty_domain",
+        "_index",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         uri: Optional[str] = None,
@@ -22,6 +107,8 @@ class CellArrayBaseFrame(ABC):
         mode: Optional[Literal["r", "w", "d", "m"]] = None,
         config_or_context: Optional[Union[tiledb.Config, tiledb.Ctx]] = None,
         validate: bool = True,
+        cache_size: int = 0,
+        dtype_backend: Literal["numpy", "pyarrow"] = "numpy",
     ):
         """Initialize the object.
 
@@ -40,11 +127,35 @@ class CellArrayBaseFrame(ABC):
 
             validate:
                 Whether to validate the connection.
+
+            cache_size:
+                Number of recent read results to keep in memory. Defaults
+                to 0 (disabled). Cached results are kept whole, so only
+                enable this for small, repeated selections. Like the read
+                handle, they do not see writes made through other frame
+                instances or processes until :py:meth:`refresh` is called.
+
+            dtype_backend:
+                Backend for the columns of returned DataFrames. "numpy" (default)
+                gives NumPy-backed columns; "pyarrow" keeps reads as Arrow-backed
+                ``pd.ArrowDtype`` columns, which avoids converting Arrow buffers
+                into NumPy arrays.
         """
         self._array_passed_in = False
         self._opened_array_external = None
+        self._cached_read_array = None
+        self._read_cache = OrderedDict()
+        self._read_cache_size = cache_size
         self._ctx = None
 
+        if dtype_backend not in ("numpy", "pyarrow"):
+            raise ValueError("'dtype_backend' must be one of: 'numpy', 'pyarrow'.")
+
+        if dtype_backend == "pyarrow" and not hasattr(pd, "ArrowDtype"):
+            raise ImportError("'dtype_backend=\"pyarrow\"' requires pandas>=1.5.")
+
+        self._dtype_backend = dtype_backend
+
         if tiledb_array_obj is not None:
             if not tiledb_array_obj.isopen:
                 raise ValueError("Provided 'tiledb_array_obj' must be open.")
@@ -64,17 +175,11 @@ class CellArrayBaseFrame(ABC):
             self._mode = mode
             self._array_passed_in = False
 
-            if config_or_context is None:
-                self._ctx = None
-            elif isinstance(config_or_context, tiledb.Config):
-                self._ctx = tiledb.Ctx(config_or_context)
-            elif isinstance(config_or_context, tiledb.Ctx):
-                self._ctx = config_or_context
-            else:
-                raise TypeError("'config_or_context' must be a TileDB Config or Ctx object.")
+            self._ctx = _get_or_create_ctx(config_or_context)
         else:
             raise ValueError("Either 'uri' or 'tiledb_array_obj' must be provided.")
 
+        self._schema_cache = None
         self._column_names = None
         self._index_names = None
         self._shape = None
@@ -85,10 +190,16 @@ class CellArrayBaseFrame(ABC):
             self._validate()
 
     def _validate(self):
-        """Validate that the URI points to a valid TileDB array/dataframe."""
-        with self.open_array(mode="r") as A:
-            if not isinstance(A, (tiledb.Array, tiledb.SparseArray, tiledb.DenseArray)):
-                pass
+        """Validate that the URI points to a valid TileDB array/dataframe.
+
+        Uses :py:func:`tiledb.object_type`, a single lightweight lookup,
+        instead of opening the array and loading its fragment metadata.
+        """
+        if self._array_passed_in:
+            return
+
+        if tiledb.object_type(self.uri, ctx=self._ctx) != "array":
+            raise ValueError(f"'{self.uri}' is not a TileDB array.")
 
     @property
     def mode(self) -> Optional[str]:
@@ -122,18 +233,81 @@ class CellArrayBaseFrame(ABC):
             yield self._opened_array_external
         else:
             effective_mode = mode if mode is not None else (self.mode or "r")
-            array = tiledb.open(self.uri, mode=effective_mode, ctx=self._ctx)
-            try:
-                yield array
-            finally:
-                array.close()
+            if effective_mode == "r":
+                # Keep one read handle resident; opening re-fetches fragment metadata.
+                # See `refresh` for seeing writes made elsewhere.
+                if self._cached_read_array is None or not self._cached_read_array.isopen:
+                    self._cached_read_array = tiledb.open(self.uri, mode="r", ctx=self._ctx)
+
+                yield self._cached_read_array
+            else:
+                array = tiledb.open(self.uri, mode=effective_mode, ctx=self._ctx)
+                try:
+                    yield array
+                finally:
+                    array.close()
+
+    def close(self) -> None:
+        """Close the cached read handle, if any.
+
+        Externally provided arrays are left untouched.
+        """
+        if self._cached_read_array is not None:
+            if self._cached_read_array.isopen:
+                self._cached_read_array.close()
+            self._cached_read_array = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _load_schema_metadata(self) -> dict:
+        """Load schema-derived metadata with a single array open and cache it.
+
+        Returns:
+            A dictionary with the sparse flag, attribute names, dtypes,
+            fill values, nullability and enumeration labels, and dimension
+            names, dtypes and domains.
+        """
+        if self._schema_cache is None:
+            with self.open_array(mode="r") as A:
+                schema = A.schema
+                attrs = [schema.attr(i) for i in range(schema.nattr)]
+                dims = list(schema.domain)
+
+                self._schema_cache = {
+                    "sparse": schema.sparse,
+                    "nattr": schema.nattr,
+                    "attr_names": [attr.name for attr in attrs],
+                    "attr_dtypes": {attr.name: attr.dtype for attr in attrs},
+                    "fills": {attr.name: None if attr.isnullable else attr.fill for attr in attrs},
+                    "nullable": {attr.name: attr.isnullable for attr in attrs},
+                    "enum_labels": {attr.name: attr.enum_label for attr in attrs},
+                    "ndim": schema.domain.ndim,
+                    "dim_names": [dim.name for dim in dims],
+                    "dim_dtypes": {dim.name: dim.dtype for dim in dims},
+                    "dim_domains": {dim.name: dim.domain for dim in dims},
+                }
+
+            self._column_names = list(self._schema_cache["attr_names"])
+            self._index_names = list(self._schema_cache["dim_names"])
+
+        return self._schema_cache
+
+    def invalidate_schema_cache(self) -> None:
+        """Drop cached schema metadata, e.g. after the schema was evolved."""
+        self._schema_cache = None
+        self._column_names = None
+        self._index_names = None
+        self._shape = None
 
     @property
     def column_names(self) -> List[str]:
         """Get attribute/column names of the dataframe."""
         if self._column_names is None:
-            with self.open_array(mode="r") as A:
-                self._column_names = [A.schema.attr(i).name for i in range(A.schema.nattr)]
+            self._load_schema_metadata()
 
         return self._column_names
 
@@ -141,69 +315,81 @@ class CellArrayBaseFrame(ABC):
     def index_names(self) -> List[str]:
         """Get dimension/index names of the dataframe."""
         if self._index_names is None:
-            with self.open_array(mode="r") as A:
-                self._index_names = [dim.name for dim in A.schema.domain]
+            self._load_schema_metadata()
 
         return self._index_names
 
+    @property
+    def dtypes(self) -> pd.Series:
+        """Get the dtypes of the attributes/columns."""
+        meta = self._load_schema_metadata()
+        return pd.Series(meta["attr_dtypes"], dtype=object)
+
     @property
     def index(self) -> pd.DataFrame:
         """Get index of the dataframe."""
         if self._index is None:
-            with self.open_array(mode="r") as A:
-                if A.schema.sparse:
-                    try:
-                        self._index = pd.DataFrame(A.query(attrs=[])[:])
-                    except Exception as _:
-                        warn("Failed to get index values.")
-                        self._index = pd.DataFrame()
-                else:
+            meta = self._load_schema_metadata()
+            if meta["sparse"]:
+                try:
+                    with self.open_array(mode="r") as A:
+                        raw = A.query(attrs=[], dims=meta["dim_names"])[:]
+
+                    self._index = pd.DataFrame(
+                        {name: _decode_bytes(values) for name, values in raw.items()},
+                        copy=False,
+                    )
+                except Exception as _:
+                    warn("Failed to get index values.")
                     self._index = pd.DataFrame()
+            else:
+                self._index = pd.DataFrame()
         return self._index
 
     def rownames(self) -> pd.DataFrame:
         """Alias to :py:meth:`index`."""
         return self.index
 
+    def _get_nonempty_domain(self) -> Optional[Tuple[Any, ...]]:
+        """Get the non-empty domain of the array, fetched once and memoized."""
+        if self._nonempty_domain is None:
+            with self.open_array(mode="r") as A:
+                self._nonempty_domain = A.nonempty_domain()
+
+        return self._nonempty_domain
+
     @property
     def shape(self) -> Tuple[int, ...]:
         """Get the shape of the dataframe (rows, columns)."""
         if self._shape is None:
-            with self.open_array(mode="r") as A:
-                ned = A.nonempty_domain()
-                rows = 0
-                is_sparse = A.schema.sparse
-
-                if is_sparse:
-                    ned = A.nonempty_domain()
-                    if ned:
-                        dim0_ned = ned[0]
-                        if isinstance(dim0_ned, tuple) and len(dim0_ned) == 2:
-                            if isinstance(dim0_ned[0], (int, np.integer, float, np.floating)):
-                                rows = int(dim0_ned[1]) - int(dim0_ned[0]) + 1
-                            else:
-                                rows = -1
-                        else:
-                            rows = -1
-                else:
-                    dom = A.schema.domain
-                    if dom.ndim == 1:
-                        if not np.issubdtype(dom.dim(0).dtype, np.str_):
-                            dmin = int(dom.dim(0).domain[0])
-                            dmax = int(dom.dim(0).domain[1])
-                            rows = dmax - dmin + 1
+            meta = self._load_schema_metadata()
+            rows = 0
+
+            if meta["sparse"]:
+                ned = self._get_nonempty_domain()
+                if ned:
+                    dim0_ned = ned[0]
+                    if isinstance(dim0_ned, tuple) and len(dim0_ned) == 2:
+                        if isinstance(dim0_ned[0], (int, np.integer, float, np.floating)):
+                            rows = int(dim0_ned[1]) - int(dim0_ned[0]) + 1
                         else:
                             rows = -1
                     else:
-                        try:
-                            rows = A.shape[0]
-                        except Exception:
-                            rows = -1
+                        rows = -1
+            else:
+                # Dense extents come from the schema domain; no non-empty domain probe needed.
+                dim0 = meta["dim_names"][0]
+                try:
+                    dmin, dmax = meta["dim_domains"][dim0]
+                    rows = int(dmax) - int(dmin) + 1
+                except (TypeError, ValueError):
+                    rows = -1
 
-                self._shape = (rows, A.schema.nattr)
+            self._shape = (rows, meta["nattr"])
         return self._shape
 
     def vacuum(self) -> None:
+        self.close()
         tiledb.vacuum(self.uri, ctx=self._ctx)
 
     def consolidate(self) -> None:
@@ -222,13 +408,14 @@ class CellArrayBaseFrame(ABC):
             key:
                 - str: Query condition (e.g., "age > 20")
                 - slice/int: Row selection
-                - tuple: (rows, columns) selection
+                - tuple: (rows, columns) selection, where columns may be
+                  names, integer positions, or a slice/range of positions.
         """
         row_spec = slice(None)
         col_spec = None  # None implies all columns
 
         if isinstance(key, str):
-            return self._read_query(condition=key, columns=None)
+            return self._cached_read(key, None)
 
         if not isinstance(key, tuple):
             key = (key,)
@@ -243,11 +430,62 @@ class CellArrayBaseFrame(ABC):
                 if isinstance(col_spec, range):
                     col_spec = slice(col_spec.start, col_spec.stop, col_spec.step)
                 col_spec = self.column_names[col_spec]
+            else:
+                positions = np.atleast_1d(col_spec)
+                if positions.dtype.kind in "iu":
+                    col_spec = np.asarray(self.column_names)[positions].tolist()
+
+        return self._cached_read(row_spec, col_spec)
+
+    def _cached_read(self, row_spec: Any, col_spec: Optional[List[str]]) -> pd.DataFrame:
+        """Dispatch a read, serving repeated selections from the LRU cache.
+
+        Strings are routed to :py:meth:`_read_query`, everything else to
+        :py:meth:`_read_slice`. The cache holds its own copy of each result
+        and hands out copies, so callers cannot mutate cached frames.
+        """
+        cache = self._read_cache
+        cache_size = self._read_cache_size
+
+        key = _make_cache_key(row_spec, col_spec) if cache_size > 0 else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                return cached.copy()
 
         if isinstance(row_spec, str):
-            return self._read_query(condition=row_spec, columns=col_spec)
+            result = self._read_query(condition=row_spec, columns=col_spec)
+        else:
+            result = self._read_slice(row_spec, col_spec)
+
+        if key is None:
+            return result
+
+        cache[key] = result.copy()
+        if len(cache) > cache_size:
+            cache.popitem(last=False)
+
+        return result
+
+    def refresh(self) -> None:
+        """Pick up writes made since the read handle was opened.
+
+        Reads go through a handle pinned to its open timestamp, so writes made
+        through other frame instances or processes are not visible until this
+        is called. Also drops cached read results and derived state.
+        """
+        # Reopening refreshes the fragment list without a full open.
+        if self._cached_read_array is not None and self._cached_read_array.isopen:
+            self._cached_read_array.reopen()
+        self.clear_read_cache()
+        self._shape = None
+        self._nonempty_domain = None
+        self._index = None
 
-        return self._read_slice(row_spec, col_spec)
+    def clear_read_cache(self) -> None:
+        """Drop all cached read results."""
+        self._read_cache.clear()
 
     @abstractmethod
     def _read_slice(self, rows: Any, cols: Optional[List[str]]) -> pd.DataFrame:
@@ -1,18 +1,103 @@
-from typing import Any, List, Optional
+import json
+from typing import Any, Iterator, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import tiledb
 
-from .base import CellArrayBaseFrame
+from .base import CellArrayBaseFrame, _decode_bytes, _get_or_create_ctx
 
 __author__ = "Jayaram Kancherla"
 __copyright__ = "Jayaram Kancherla"
 __license__ = "MIT"
 
+_TARGET_NUM_TILES = 100
+_MIN_TILE_CAPACITY = 10_000
+_MAX_TILE_CAPACITY = 200_000
+
+
+def _to_inclusive_slice(rows: Any) -> Any:
+    """Convert a half-open Python slice into TileDB's inclusive form.
+
+    Non-slice selections and slices without an integer stop are returned as-is.
+    """
+    if not isinstance(rows, slice) or not isinstance(rows.stop, int):
+        return rows
+
+    # Note that `[:0]` becomes `[:-1]`, i.e. everything before the first row.
+    return slice(rows.start, rows.stop - 1, rows.step)
+
+
+def _restore_pandas_meta(df: pd.DataFrame, array_meta: Any, attr_dtypes: bool = True) -> pd.DataFrame:
+    """Apply the pandas dtypes and index stored by ``tiledb.from_pandas``.
+
+    Mirrors what TileDB's ``.df`` indexer does after reading. Set
+    ``attr_dtypes`` to False to keep the column dtypes as they are.
+    """
+    col_dtypes = {}
+    if attr_dtypes and "__pandas_attribute_repr" in array_meta:
+        for name, dtype in json.loads(array_meta["__pandas_attribute_repr"]).items():
+            if name in df:
+                col_dtypes[name] = dtype
+
+    index_cols = []
+    if "__pandas_index_dims" in array_meta:
+        for name, dtype in json.loads(array_meta["__pandas_index_dims"]).items():
+            if name in df:
+                index_cols.append(name)
+                col_dtypes[name] = dtype
+
+    if col_dtypes:
+        df = df.astype(col_dtypes, copy=False)
+
+    if index_cols:
+        df.set_index(index_cols, inplace=True)
+        # '__tiledb_rows' is the placeholder dimension for an unnamed index.
+        df.index.names = [None if name == "__tiledb_rows" else name for name in df.index.names]
+
+    return df
+
+
+def _arrow_to_pandas(table: pa.Table, array_meta: Any, dtype_backend: str = "numpy") -> pd.DataFrame:
+    """Convert an Arrow query result into a DataFrame, restoring the pandas index.
+
+    Releases the Arrow buffers while converting and keeps one block per
+    column, so the result is neither held twice in memory nor re-copied on
+    consolidation.
+
+    Args:
+        table:
+            Table returned by a ``return_arrow=True`` query. It is
+            consumed by the conversion and must not be used afterwards.
+
+        array_meta:
+            Metadata of the array the table was read from.
+
+        dtype_backend:
+            "numpy" for NumPy-backed columns, "pyarrow" to keep the
+            columns as zero-copy ``pd.ArrowDtype`` arrays.
+    """
+    if dtype_backend == "pyarrow":
+        df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+        return _restore_pandas_meta(df, array_meta, attr_dtypes=False)
+
+    # One block per column avoids pandas consolidating the columns into a fresh copy.
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    return _restore_pandas_meta(df, array_meta)
+
 
 class CellArrayFrame(CellArrayBaseFrame):
     """Implementation for TileDB DataFrames."""
 
+    __slots__ = ()
+
+    def _has_plain_attrs(self, attrs: List[str]) -> bool:
+        """Whether none of the attributes need Arrow's null or enumeration handling."""
+        meta = self._load_schema_metadata()
+        # Unknown names are left for the query to report.
+        return not any(meta["nullable"].get(name, False) or meta["enum_labels"].get(name) for name in attrs)
+
     def _read_slice(self, rows: Any, cols: Optional[List[str]]) -> pd.DataFrame:
         """Read data using direct slicing.
 
@@ -23,24 +108,25 @@ class CellArrayFrame(CellArrayBaseFrame):
             cols:
                 List of column names to retrieve.
         """
-        if isinstance(rows, slice):
-            start = rows.start
-            stop = rows.stop
-            step = rows.step
-
-            if stop is not None and isinstance(stop, int):
-                if stop == 0 and start is None:
-                    stop = -1
-                else:
-                    stop -= 1
-
-            rows = slice(start, stop, step)
+        rows = _to_inclusive_slice(rows)
 
         with self.open_array(mode="r") as array:
             attrs = cols if cols is not None else self.column_names
-            query = array.query(attrs=attrs)
 
-            return query.df[rows]
+            if isinstance(rows, (int, np.integer)) and self._dtype_backend == "numpy" and self._has_plain_attrs(attrs):
+                # Point lookups are cheaper as plain arrays than through an Arrow table.
+                data = array.query(attrs=attrs).multi_index[rows]
+                # Only dimensions are decoded; Arrow returns ascii attributes as bytes too.
+                dims = self.index_names
+                df = pd.DataFrame(
+                    {name: _decode_bytes(values) if name in dims else values for name, values in data.items()},
+                    copy=False,
+                )
+                return _restore_pandas_meta(df, array.meta)
+
+            query = array.query(attrs=attrs, return_arrow=True)
+
+            return _arrow_to_pandas(query.df[rows], array.meta, self._dtype_backend)
 
     def _read_query(self, condition: str, columns: Optional[List[str]]) -> pd.DataFrame:
         """Read data using a string query condition.
@@ -54,27 +140,195 @@ class CellArrayFrame(CellArrayBaseFrame):
         """
         with self.open_array(mode="r") as array:
             attrs = columns if columns is not None else self.column_names
-            return array.query(cond=condition, attrs=attrs).df[:]
+            table = array.query(cond=condition, attrs=attrs, return_arrow=True).df[:]
+            return _arrow_to_pandas(table, array.meta, self._dtype_backend)
+
+    def iter_batches(
+        self, condition: Optional[str] = None, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Read the frame as a sequence of DataFrames to bound peak memory.
+
+        Batches come from TileDB's incomplete-query reader, so their size is
+        set by the ``py.init_buffer_bytes`` option of the TileDB config
+        (pass a Config via ``config_or_context``). Ordering, joins or sorts
+        across batches are left to the caller.
+
+        Args:
+            condition:
+                Optional TileDB query string (e.g. "val > 5.0").
+
+            columns:
+                List of column names to retrieve. Defaults to all columns.
+
+        Yields:
+            DataFrames holding consecutive parts of the result.
+        """
+        with self.open_array(mode="r") as array:
+            attrs = columns if columns is not None else self.column_names
+            query = array.query(cond=condition, attrs=attrs, return_incomplete=True, return_arrow=True)
+
+            for table in query.df[:]:
+                yield _arrow_to_pandas(table, array.meta, self._dtype_backend)
 
-    def write_batch(self, data: pd.DataFrame, append: bool = True, **kwargs) -> None:
+    def write_batch(
+        self,
+        data: Union[pd.DataFrame, pa.Table, pa.RecordBatch],
+        append: bool = True,
+        chunk_size: Optional[int] = 1_000_000,
+        consolidate_threshold: Optional[int] = None,
+        **kwargs,
+    ) -> None:
         """Write a batch of data to the frame.
 
         Args:
             data:
-                Pandas DataFrame to write.
+                Pandas DataFrame to write. Sparse frames can also be appended
+                to from a pyarrow Table or RecordBatch that has one column per
+                dimension and attribute.
 
             append:
                 If True, appends to existing array. If False, might overwrite/schema_only
                 depending on lower-level tiledb.from_pandas behavior, but mostly used for appending.
+
+            chunk_size:
+                When appending, frames with more rows than this are written in
+                successive chunks of ``chunk_size`` rows to bound peak memory.
+                Each chunk creates its own fragment. Set to None to always
+                write in a single call.
+
+            consolidate_threshold:
+                If set, consolidate and vacuum the array after the write once
+                it has more than this many fragments. Reads slow down as
+                fragments accumulate since each one is scanned separately.
+
+        Appending a frame whose columns are all Arrow-backed (``pd.ArrowDtype``)
+        and whose index names the dimensions of a sparse frame bypasses
+        ``tiledb.from_pandas`` and writes from the Arrow buffers directly,
+        unless extra keyword arguments are given.
+        Arrow writes take no extra keyword arguments, and nulls are only
+        accepted in nullable attributes.
+        """
+        if append and len(data) == 0:
+            return
+
+        if isinstance(data, (pa.Table, pa.RecordBatch)):
+            if not append:
+                raise ValueError("Arrow data can only be appended to an existing frame.")
+
+            if isinstance(data, pa.RecordBatch):
+                data = pa.Table.from_batches([data])
+
+            self._write_arrow(data, chunk_size=chunk_size, **kwargs)
+        elif append and self._can_write_arrow(data, kwargs):
+            # Arrow-backed columns are written straight from their Arrow buffers.
+            self._write_arrow(pa.Table.from_pandas(data, preserve_index=True), chunk_size=chunk_size, **kwargs)
+        elif append and chunk_size is not None and len(data) > chunk_size:
+            row_start_idx = kwargs.pop("row_start_idx", None)
+            for start in range(0, len(data), chunk_size):
+                if row_start_idx is not None:
+                    kwargs["row_start_idx"] = row_start_idx + start
+
+                tiledb.from_pandas(
+                    uri=self.uri,
+                    dataframe=data.iloc[start : start + chunk_size],
+                    mode="append",
+                    ctx=self._ctx,
+                    **kwargs,
+                )
+        else:
+            mode = "append" if append else "ingest"
+            tiledb.from_pandas(uri=self.uri, dataframe=data, mode=mode, ctx=self._ctx, **kwargs)
+
+        self.refresh()
+
+        if consolidate_threshold is not None:
+            if len(tiledb.array_fragments(self.uri, ctx=self._ctx)) > consolidate_threshold:
+                self.consolidate()
+
+    def _can_write_arrow(self, data: pd.DataFrame, kwargs: dict) -> bool:
+        """Whether an appended frame can skip ``tiledb.from_pandas`` and be written from its Arrow buffers.
+
+        Only frames whose columns are all Arrow-backed and whose index names
+        the dimensions of a sparse frame qualify. Extra ``from_pandas``
+        arguments and externally managed arrays go through ``from_pandas``.
         """
-        mode = "append" if append else "ingest"
-        tiledb.from_pandas(uri=self.uri, dataframe=data, mode=mode, ctx=self._ctx, **kwargs)
-        self._shape = None
-        self._index = None
+        if kwargs or self._array_passed_in or len(data.columns) == 0:
+            return False
+
+        if not all(isinstance(dtype, pd.ArrowDtype) for dtype in data.dtypes):
+            return False
+
+        meta = self._load_schema_metadata()
+        return meta["sparse"] and list(data.index.names) == meta["dim_names"]
+
+    def _write_arrow(self, table: pa.Table, chunk_size: Optional[int] = None, **kwargs) -> None:
+        """Write an Arrow table whose columns are named after the dimensions and attributes.
+
+        Numeric columns are handed to TileDB as views over the Arrow buffers,
+        avoiding the per-column copies made by ``tiledb.from_pandas``. Columns
+        holding nulls are converted to object arrays, which TileDB writes as
+        nulls in nullable attributes.
+
+        Args:
+            table:
+                Table to write.
+
+            chunk_size:
+                Write tables with more rows than this in successive chunks.
+                Set to None to write in a single call.
+        """
+        if kwargs:
+            raise TypeError(f"Unsupported arguments for Arrow writes: {sorted(kwargs)}.")
+
+        meta = self._load_schema_metadata()
+        if not meta["sparse"]:
+            raise ValueError("Writing Arrow data is only supported for sparse frames.")
+
+        missing = [name for name in meta["dim_names"] + meta["attr_names"] if name not in table.column_names]
+        if missing:
+            raise ValueError(f"Arrow data is missing columns: {missing}.")
+
+        unknown = [name for name in table.column_names if name not in meta["dim_names"] + meta["attr_names"]]
+        if unknown:
+            raise ValueError(f"Arrow data has columns that are not dimensions or attributes: {unknown}.")
+
+        for name in meta["dim_names"]:
+            if table.column(name).null_count > 0:
+                raise ValueError(f"Input dimension '{name}' contains nulls.")
+
+        for name in meta["attr_names"]:
+            if table.column(name).null_count > 0 and not meta["nullable"][name]:
+                raise ValueError(f"Input attribute '{name}' is not nullable but contains nulls.")
+
+        if chunk_size is None or len(table) <= chunk_size:
+            chunks = [table]
+        else:
+            chunks = [table.slice(start, chunk_size) for start in range(0, len(table), chunk_size)]
+
+        with self.open_array(mode="w") as A:
+            for chunk in chunks:
+                coords = tuple(chunk.column(name).to_numpy() for name in meta["dim_names"])
+                values = {}
+                for name in meta["attr_names"]:
+                    column = chunk.column(name)
+                    if column.null_count > 0:
+                        # TileDB derives the validity of nullable attributes from the None entries.
+                        values[name] = np.array(column.to_pylist(), dtype=object)
+                    else:
+                        values[name] = column.to_numpy()
+
+                A[coords] = values
 
     @classmethod
     def create(
-        cls, uri: str, data: pd.DataFrame, index_dims: Optional[List[str]] = None, full_domain: bool = True, **kwargs
+        cls,
+        uri: str,
+        data: pd.DataFrame,
+        index_dims: Optional[List[str]] = None,
+        full_domain: bool = True,
+        config_or_context: Optional[Union[tiledb.Config, tiledb.Ctx]] = None,
+        tile_capacity: Optional[int] = None,
+        **kwargs,
     ):
         """Helper to create a new CellFrame from a dataframe.
 
@@ -90,6 +344,33 @@ class CellArrayFrame(CellArrayBaseFrame):
 
             full_domain:
                 Whether to allow the domain to extend to the full range of the dtype (default True).
+
+            config_or_context:
+                TileDB Config or Ctx. Resolved once and shared by the ingest
+                and the returned frame.
+
+            tile_capacity:
+                Number of cells per data tile for sparse arrays. Sparse data
+                tiles are sized by cell count rather than by the space tiling,
+                so large frames stored with small tiles carry a lot of
+                per-tile metadata. Unless ``sparse=False`` or ``capacity`` is
+                passed, defaults to ``len(data) / 100`` bounded to
+                [10,000, 200,000] (10,000 being TileDB's default); this also
+                covers arrays ``tiledb.from_pandas`` makes sparse on its own.
+                Dense arrays keep TileDB's default. Passing both this and
+                ``capacity`` raises a ValueError.
         """
-        tiledb.from_pandas(uri, data, index_dims=index_dims, full_domain=full_domain, **kwargs)
-        return cls(uri=uri)
+        if tile_capacity is not None and "capacity" in kwargs:
+            raise ValueError("Pass only one of 'tile_capacity' and 'capacity'.")
+
+        # ``from_pandas`` may pick a sparse schema on its own (e.g. for string
+        # indexes) and ignores the capacity of dense arrays.
+        if kwargs.get("sparse") is not False and tile_capacity is None and "capacity" not in kwargs:
+            tile_capacity = min(max(len(data) // _TARGET_NUM_TILES, _MIN_TILE_CAPACITY), _MAX_TILE_CAPACITY)
+
+        if tile_capacity is not None:
+            kwargs["capacity"] = tile_capacity
+
+        ctx = _get_or_create_ctx(config_or_context)
+        tiledb.from_pandas(uri, data, index_dims=index_dims, full_domain=full_domain, ctx=ctx, **kwargs)
+        return cls(uri=uri, config_or_context=ctx)
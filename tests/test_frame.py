@@ -4,22 +4,38 @@ import unittest
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import tiledb
 
 from cellarr_frame import CellArrayFrame
 
 
 class TestCellArrayFrame(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Built once and shared; tests that write use `_writable_uri`.
+        cls.class_dir = tempfile.mkdtemp()
+        cls.uri = f"{cls.class_dir}/test_frame"
+
+        cls.df = pd.DataFrame({"name": ["A", "B", "C", "D"], "value": [1, 2, 3, 4], "group": ["x", "x", "y", "y"]})
+        cls.df.index.name = "row_id"
+        tiledb.from_pandas(cls.uri, cls.df, sparse=True, full_domain=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        tiledb.VFS().remove_dir(cls.class_dir)
+
     def setUp(self):
         self.test_dir = tempfile.mkdtemp()
-        self.uri = f"{self.test_dir}/test_frame"
-
-        self.df = pd.DataFrame({"name": ["A", "B", "C", "D"], "value": [1, 2, 3, 4], "group": ["x", "x", "y", "y"]})
-        self.df.index.name = "row_id"
-        tiledb.from_pandas(self.uri, self.df, sparse=True, full_domain=True)
 
     def tearDown(self):
-        shutil.rmtree(self.test_dir)
+        tiledb.VFS().remove_dir(self.test_dir)
+
+    def _writable_uri(self):
+        """Copy the shared array into this test's directory."""
+        uri = f"{self.test_dir}/test_frame"
+        shutil.copytree(self.uri, uri)
+        return uri
 
     def test_init(self):
         """Test initialization and properties."""
@@ -31,6 +47,157 @@ class TestCellArrayFrame(unittest.TestCase):
         self.assertIn("row_id", cf.index.columns)
         pd.testing.assert_frame_equal(cf.index, pd.DataFrame({"row_id": range(0, 4)}))
 
+    def test_validate(self):
+        """Test validation without opening the array."""
+        with self.assertRaises(ValueError):
+            CellArrayFrame(uri=f"{self.test_dir}/missing")
+
+        CellArrayFrame(uri=f"{self.test_dir}/missing", validate=False)
+
+    def test_schema_cache(self):
+        """Test schema metadata is loaded once and exposed via properties."""
+        cf = CellArrayFrame(uri=self.uri)
+        self.assertEqual(cf.index_names, ["row_id"])
+        self.assertEqual(list(cf.dtypes.index), ["name", "value", "group"])
+        self.assertEqual(cf.dtypes["value"], np.dtype("int64"))
+        self.assertEqual(cf.shape, (4, 3))
+
+        self.assertFalse(hasattr(cf, "__dict__"))
+
+        cf.invalidate_schema_cache()
+        self.assertEqual(len(cf.column_names), 3)
+
+    def test_cached_read_handle(self):
+        """Test reads reuse a single read handle until closed."""
+        cf = CellArrayFrame(uri=self.uri)
+        with cf.open_array() as handle:
+            self.assertTrue(handle.isopen)
+
+        cf["value > 2"]
+        with cf.open_array() as A:
+            self.assertIs(A, handle)
+
+        cf.close()
+        self.assertFalse(handle.isopen)
+        self.assertEqual(len(cf[0:2]), 2)
+
+        with CellArrayFrame(uri=self.uri) as cf:
+            with cf.open_array() as handle:
+                pass
+        self.assertFalse(handle.isopen)
+
+    def test_refresh(self):
+        """Test writes from another frame become visible after a refresh."""
+        uri = self._writable_uri()
+        reader = CellArrayFrame(uri=uri, cache_size=2)
+        self.assertEqual(len(reader[:]), 4)
+
+        new_df = pd.DataFrame({"name": ["E"], "value": [5], "group": ["z"]}, index=pd.Index([4], name="row_id"))
+        CellArrayFrame(uri=uri).write_batch(new_df)
+        self.assertEqual(len(reader[:]), 4)
+
+        reader.refresh()
+        self.assertEqual(len(reader[:]), 5)
+
+    def test_read_cache(self):
+        """Test repeated reads are served from the LRU cache."""
+        cf = CellArrayFrame(uri=self.uri, cache_size=2)
+
+        res = cf[0:2]
+        res.loc[0, "name"] = "changed"
+        res.drop(columns=["value"], inplace=True)
+        pd.testing.assert_frame_equal(cf[0:2], CellArrayFrame(uri=self.uri)[0:2])
+
+        hit = cf[0:2, "name"]
+        hit.loc[0, "name"] = "changed"
+        self.assertEqual(cf[0:2, ["name"]].iloc[0]["name"], "A")
+
+        # Results stay cached across reopening the handle until cleared or evicted.
+        uri = self._writable_uri()
+        cf = CellArrayFrame(uri=uri, cache_size=2)
+        writer = CellArrayFrame(uri=uri)
+        self.assertEqual(len(cf[:]), 4)
+
+        writer.write_batch(
+            pd.DataFrame({"name": ["E"], "value": [5], "group": ["z"]}, index=pd.Index([4], name="row_id"))
+        )
+        cf.close()
+        self.assertEqual(len(cf[:]), 4)
+        cf.clear_read_cache()
+        self.assertEqual(len(cf[:]), 5)
+
+        writer.write_batch(
+            pd.DataFrame({"name": ["F"], "value": [6], "group": ["z"]}, index=pd.Index([5], name="row_id"))
+        )
+        cf.close()
+        cf["value > 2"]
+        cf[[0, 1]]
+        self.assertEqual(len(cf[:]), 6)
+
+    def test_shared_ctx(self):
+        """Test frames opened with equal configs share one Ctx."""
+        cfg = tiledb.Config({"sm.tile_cache_size": "1000000"})
+        cf1 = CellArrayFrame(uri=self.uri, config_or_context=cfg)
+        cf2 = CellArrayFrame(uri=self.uri, config_or_context=tiledb.Config({"sm.tile_cache_size": "1000000"}))
+        with cf1.open_array() as A, cf2.open_array() as B:
+            self.assertIs(A.ctx, B.ctx)
+
+        with self.assertRaises(TypeError):
+            CellArrayFrame(uri=self.uri, config_or_context={"sm.tile_cache_size": "1000000"})
+
+    def test_dense_shape(self):
+        """Test shape of a dense frame is derived from the schema domain."""
+        uri = f"{self.test_dir}/dense_frame"
+        tiledb.from_pandas(uri, self.df.reset_index(drop=True))
+
+        cf = CellArrayFrame(uri=uri)
+        self.assertEqual(cf.shape, (4, 3))
+
+    def test_create(self):
+        """Test creating a frame with a config shares the pooled Ctx."""
+        cfg = tiledb.Config({"sm.tile_cache_size": "1000000"})
+        cf = CellArrayFrame.create(f"{self.test_dir}/created", self.df, sparse=True, config_or_context=cfg)
+        other = CellArrayFrame(uri=self.uri, config_or_context=cfg)
+
+        self.assertEqual(cf[:]["value"].tolist(), [1, 2, 3, 4])
+
+        with cf.open_array() as A, other.open_array() as B:
+            self.assertIs(A.ctx, B.ctx)
+            self.assertEqual(A.schema.capacity, 10_000)
+
+        cf = CellArrayFrame.create(f"{self.test_dir}/created_cap", self.df, sparse=True, tile_capacity=2)
+        with cf.open_array() as A:
+            self.assertEqual(A.schema.capacity, 2)
+
+        cf = CellArrayFrame.create(f"{self.test_dir}/created_kw", self.df, sparse=True, capacity=5000)
+        with cf.open_array() as A:
+            self.assertEqual(A.schema.capacity, 5000)
+
+        big = pd.DataFrame({"value": np.arange(1_500_000)}, index=pd.Index(np.arange(1_500_000).astype(str), name="id"))
+        cf = CellArrayFrame.create(f"{self.test_dir}/created_str", big)
+        with cf.open_array() as A:
+            self.assertTrue(A.schema.sparse)
+            self.assertEqual(A.schema.capacity, 15_000)
+
+        with self.assertRaises(ValueError):
+            CellArrayFrame.create(f"{self.test_dir}/created_both", self.df, sparse=True, tile_capacity=2, capacity=5)
+
+    def test_dtype_backend_pyarrow(self):
+        """Test reads return Arrow-backed columns when requested."""
+        cf = CellArrayFrame(uri=self.uri, dtype_backend="pyarrow")
+
+        res = cf[0:2]
+        self.assertTrue(all(isinstance(dtype, pd.ArrowDtype) for dtype in res.dtypes))
+        self.assertEqual(res.index.name, "row_id")
+        self.assertEqual(res["name"].tolist(), ["A", "B"])
+
+        res_q = cf["value > 2", ["value"]]
+        self.assertEqual(res_q["value"].tolist(), [3, 4])
+        self.assertIsInstance(cf[1].dtypes["value"], pd.ArrowDtype)
+
+        with self.assertRaises(ValueError):
+            CellArrayFrame(uri=self.uri, dtype_backend="polars")
+
     def test_slice_rows(self):
         """Test slicing rows."""
         cf = CellArrayFrame(uri=self.uri)
@@ -40,6 +207,18 @@ class TestCellArrayFrame(unittest.TestCase):
         self.assertEqual(res.iloc[0]["name"], "A")
         self.assertEqual(res.iloc[1]["name"], "B")
 
+        res_i = cf[2]
+        pd.testing.assert_frame_equal(res_i, cf[2:3])
+        self.assertEqual(res_i.index.tolist(), [2])
+
+        uri = f"{self.test_dir}/ascii_attr"
+        tiledb.from_pandas(
+            uri, self.df.assign(name=self.df["name"].str.encode("ascii")), sparse=True, column_types={"name": np.bytes_}
+        )
+        cf = CellArrayFrame(uri=uri)
+        pd.testing.assert_frame_equal(cf[0], cf[0:1])
+        self.assertEqual(cf[0]["name"].iloc[0], b"A")
+
     def test_slice_cols(self):
         """Test slicing rows and specific columns."""
         cf = CellArrayFrame(uri=self.uri)
@@ -63,6 +242,16 @@ class TestCellArrayFrame(unittest.TestCase):
         resr = cf[0:1, range(0, 2)]
         pd.testing.assert_frame_equal(res, resr)
 
+        res_i = cf[0:1, [0, 2]]
+        self.assertEqual(list(res_i.columns), ["name", "group"])
+        pd.testing.assert_frame_equal(cf[0:1, 1], res_v)
+
+        with self.assertRaises(IndexError):
+            cf[0:1, [5]]
+
+        with self.assertRaises(tiledb.TileDBError):
+            cf[1, ["nope"]]
+
     def test_query_condition(self):
         """Test string query conditions."""
         cf = CellArrayFrame(uri=self.uri)
@@ -85,15 +274,34 @@ class TestCellArrayFrame(unittest.TestCase):
         actual_names = sorted(res["name"].tolist())
         self.assertEqual(actual_names, expected_names)
 
+    def test_iter_batches(self):
+        """Test reading in batches bounded by the result buffer size."""
+        uri = f"{self.test_dir}/batched"
+        df = pd.DataFrame({"value": np.arange(1000)})
+        df.index.name = "row_id"
+        tiledb.from_pandas(uri, df, sparse=True, full_domain=True)
+
+        cf = CellArrayFrame(uri=uri, config_or_context=tiledb.Config({"py.init_buffer_bytes": str(1024)}))
+        batches = list(cf.iter_batches())
+        self.assertGreater(len(batches), 1)
+        pd.testing.assert_frame_equal(pd.concat(batches), cf[:])
+
+        filtered = pd.concat(cf.iter_batches(condition="value >= 990", columns=["value"]))
+        self.assertEqual(filtered["value"].tolist(), list(range(990, 1000)))
+
     def test_append(self):
         """Test appending data."""
-        cf = CellArrayFrame(uri=self.uri)
+        cf = CellArrayFrame(uri=self._writable_uri())
 
         new_df = pd.DataFrame({"name": ["E"], "value": [5], "group": ["z"]})
         new_df.index = [4]
         new_df.index.name = "row_id"
 
+        with cf.open_array() as handle:
+            pass
         cf.write_batch(new_df)
+        with cf.open_array() as A:
+            self.assertIs(A, handle)
 
         res = cf[:]
         self.assertEqual(len(res), 5)
@@ -101,6 +309,143 @@ class TestCellArrayFrame(unittest.TestCase):
         self.assertEqual(len(res_e), 1)
         self.assertEqual(res_e.iloc[0]["value"], 5)
 
+    def test_append_arrow_backed(self):
+        """Test appending a frame with Arrow-backed columns."""
+        cf = CellArrayFrame(uri=self._writable_uri())
+
+        new_df = pd.DataFrame(
+            {"name": ["E", "F"], "value": [5, 6], "group": ["z", "z"]},
+            index=pd.Index([4, 5], name="row_id"),
+        ).convert_dtypes(dtype_backend="pyarrow")
+
+        cf.write_batch(new_df)
+
+        res = cf[:]
+        self.assertEqual(len(res), 6)
+        self.assertEqual(res["name"].tolist(), ["A", "B", "C", "D", "E", "F"])
+        self.assertEqual(res["value"].tolist(), [1, 2, 3, 4, 5, 6])
+
+        null_df = pd.DataFrame(
+            {
+                "name": pd.array(["G"], dtype=pd.ArrowDtype(pa.string())),
+                "value": pd.array([pd.NA], dtype="int64[pyarrow]"),
+                "group": pd.array(["z"], dtype=pd.ArrowDtype(pa.string())),
+            },
+            index=pd.Index([6], name="row_id"),
+        )
+        with self.assertRaises(ValueError):
+            cf.write_batch(null_df)
+        self.assertEqual(len(cf[:]), 6)
+
+        nullable = CellArrayFrame.create(
+            f"{self.test_dir}/nullable",
+            pd.DataFrame({"value": pd.array([1], dtype="Int64")}, index=pd.Index([0], name="row_id")),
+            index_dims=["row_id"],
+            sparse=True,
+        )
+        nullable.write_batch(
+            pd.DataFrame({"value": pd.array([pd.NA, 3], dtype="int64[pyarrow]")}, index=pd.Index([1, 2], name="row_id"))
+        )
+        self.assertEqual(nullable[:]["value"].isna().tolist(), [False, True, False])
+        self.assertEqual(nullable[2]["value"].iloc[0], 3)
+
+        # Frames the Arrow path cannot take fall back to tiledb.from_pandas.
+        arrow_df = pd.DataFrame({"value": pd.array([pd.NA, 4], dtype="int64[pyarrow]")}, index=[2, 3])
+        initial = pd.DataFrame({"value": pd.array([1, 2], dtype="Int64")})
+
+        tiledb.from_pandas(f"{self.test_dir}/unnamed", initial, sparse=True, full_domain=True)
+        unnamed = CellArrayFrame(uri=f"{self.test_dir}/unnamed")
+        unnamed.write_batch(arrow_df)
+        self.assertEqual(unnamed[:]["value"].isna().tolist(), [False, False, True, False])
+
+        tiledb.from_pandas(f"{self.test_dir}/dense", initial, full_domain=True)
+        dense = CellArrayFrame(uri=f"{self.test_dir}/dense")
+        dense.write_batch(arrow_df.reset_index(drop=True), row_start_idx=2)
+        self.assertEqual(dense[0:4]["value"].isna().tolist(), [False, False, True, False])
+
+    def test_append_empty(self):
+        """Test appending an empty frame is a no-op."""
+        cf = CellArrayFrame(uri=self.uri)
+        with cf.open_array() as handle:
+            pass
+
+        cf.write_batch(self.df.iloc[0:0])
+        with cf.open_array() as A:
+            self.assertIs(A, handle)
+        self.assertEqual(len(cf[:]), 4)
+
+    def test_append_arrow_table(self):
+        """Test appending a pyarrow Table and RecordBatch."""
+        cf = CellArrayFrame(uri=self._writable_uri())
+
+        table = pa.table({"row_id": [4], "name": ["E"], "value": [5], "group": ["z"]})
+        cf.write_batch(table)
+        cf.write_batch(pa.record_batch({"row_id": [5], "name": ["F"], "value": [6], "group": ["z"]}))
+
+        res = cf[:]
+        self.assertEqual(res["name"].tolist(), ["A", "B", "C", "D", "E", "F"])
+        self.assertEqual(res.index.tolist(), [0, 1, 2, 3, 4, 5])
+
+        with self.assertRaises(ValueError):
+            cf.write_batch(table.drop_columns(["group"]))
+
+        with self.assertRaises(ValueError):
+            cf.write_batch(table.append_column("zz", pa.array([0])))
+
+        with self.assertRaises(TypeError):
+            cf.write_batch(table, row_start_idx=10)
+
+        cf.write_batch(
+            pa.table({"row_id": [6, 7], "name": ["G", "H"], "value": [7, 8], "group": ["z", "z"]}), chunk_size=1
+        )
+        self.assertEqual(len(tiledb.array_fragments(cf.uri)), 5)
+
+    def test_append_arrow_nulls(self):
+        """Test nulls in Arrow data are kept in nullable attributes and rejected otherwise."""
+        cf = CellArrayFrame(uri=self._writable_uri())
+        with self.assertRaises(ValueError):
+            cf.write_batch(
+                pa.table({"row_id": [4], "name": ["E"], "value": pa.array([None], pa.int64()), "group": ["z"]})
+            )
+        self.assertEqual(len(cf[:]), 4)
+
+        df = pd.DataFrame(
+            {"name": pd.array(["A", None], dtype="string"), "value": pd.array([1, None], dtype="Int64")},
+            index=pd.Index([0, 1], name="row_id"),
+        )
+        cf = CellArrayFrame.create(f"{self.test_dir}/nullable", df, index_dims=["row_id"], sparse=True)
+
+        cf.write_batch(
+            pa.table(
+                {"row_id": [2, 3], "name": pa.array([None, "D"]), "value": pa.array([None, 2**60 + 1], pa.int64())}
+            )
+        )
+
+        res = cf[:]
+        self.assertEqual(res["value"].isna().tolist(), [False, True, True, False])
+        self.assertEqual(res["name"].isna().tolist(), [False, True, True, False])
+        self.assertEqual(res.loc[3, "value"], 2**60 + 1)
+
+    def test_append_chunked(self):
+        """Test appending data in multiple chunks."""
+        cf = CellArrayFrame(uri=self._writable_uri())
+
+        new_df = pd.DataFrame({"name": ["E", "F", "G"], "value": [5, 6, 7], "group": ["z", "z", "z"]})
+        new_df.index = [4, 5, 6]
+        new_df.index.name = "row_id"
+
+        cf.write_batch(new_df, chunk_size=2)
+        self.assertEqual(len(tiledb.array_fragments(cf.uri)), 3)
+
+        res = cf[:]
+        self.assertEqual(len(res), 7)
+        self.assertEqual(res["value"].tolist(), [1, 2, 3, 4, 5, 6, 7])
+
+        new_df.index = pd.Index([7, 8, 9], name="row_id")
+        cf.write_batch(new_df, chunk_size=2, consolidate_threshold=3)
+        self.assertEqual(len(tiledb.array_fragments(cf.uri)), 1)
+        self.assertEqual(len(cf[:]), 10)
+
 
 class TestCellArrayFrameMultiDim(unittest.TestCase):
     """Tests for multi-dimensional sparse arrays."""
@@ -109,7 +454,7 @@ class TestCellArrayFrameMultiDim(unittest.TestCase):
         self.test_dir = tempfile.mkdtemp()
 
     def tearDown(self):
-        shutil.rmtree(self.test_dir)
+        tiledb.VFS().remove_dir(self.test_dir)
 
     def test_index_two_int_dims(self):
         """Test .index with 2 integer dimensions."""
@@ -166,6 +511,7 @@ class TestCellArrayFrameMultiDim(unittest.TestCase):
 
         self.assertEqual(len(idx), 3)
         self.assertEqual(list(idx.columns), ["cell_id", "rank"])
+        self.assertEqual(idx["cell_id"].tolist(), ["cell_a", "cell_a", "cell_b"])
 
     def test_index_different_unique_counts(self):
         """Test .index when dimensions have different unique value counts."""
@@ -235,6 +581,9 @@ class TestCellArrayFrameMultiDim(unittest.TestCase):
         res = cf[[0, 2]]
         self.assertEqual(len(res), 3)
 
+        # Point lookup matches the equivalent slice
+        pd.testing.assert_frame_equal(cf[1], cf[1:2])
+
 
 if __name__ == "__main__":
     unittest.main()